@@ -6,20 +6,39 @@ Credentials are loaded from .env.test file automatically.
 Run integration tests:
     uv run pytest tests/integration/ -v
 
+Run them in parallel across worker processes:
+    uv run pytest tests/integration/ -n auto --dist loadgroup
+
 Skip integration tests (run only unit tests):
     uv run pytest tests/ --ignore=tests/integration/
 """
 
+import os
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 
+import httpx
 import pytest
 from thenvoi_rest import RestClient
 
+from tests.integration.pager import AdaptivePager
 from thenvoi_mcp.shared import AppContext
-from thenvoi_testing.markers import skip_without_env
 from thenvoi_testing.settings import ThenvoiTestSettings
 
+# Re-exported for the integration tests; orjson is a dev extra and the stdlib
+# functions produce equivalent JSON when it is missing. The tools take JSON
+# arguments as str, so dumps always returns str.
+try:
+    import orjson
+    from orjson import loads
+
+    def dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    from json import dumps, loads  # noqa: F401
+
 
 class TestSettings(ThenvoiTestSettings):
     """Settings for integration tests, loaded from .env.test."""
@@ -43,8 +62,47 @@ def get_test_agent_id() -> str | None:
     return test_settings.test_agent_id or None
 
 
-# Skip marker for integration tests
-requires_api = skip_without_env("THENVOI_API_KEY")
+# USE_MOCK_API=1 swaps the HTTP transport for canned error responses, so the
+# deterministic error-case tests run without a server. Tests that need real
+# data stay behind requires_api and are skipped in that mode.
+USE_MOCK_API = os.environ.get("USE_MOCK_API") == "1"
+
+# Well-formed v4 UUIDs that no real chat or participant will ever have
+FAKE_CHAT_ID = "00000000-0000-4000-8000-000000000001"
+FAKE_PARTICIPANT_ID = "00000000-0000-4000-8000-000000000002"
+MOCK_CHAT_ID = "00000000-0000-4000-8000-000000000003"
+
+# Skip markers for integration tests. Both read the key through get_api_key,
+# like api_client, so a key set only in .env.test counts too.
+if USE_MOCK_API:
+    requires_api = pytest.mark.skip(reason="USE_MOCK_API=1 disables live API tests")
+else:
+    requires_api = pytest.mark.skipif(
+        not get_api_key(), reason="THENVOI_API_KEY not set"
+    )
+
+# For tests the mock can answer: they run in mock mode or with an API key
+requires_api_or_mock = pytest.mark.skipif(
+    not USE_MOCK_API and not get_api_key(), reason="THENVOI_API_KEY not set"
+)
+
+# Largest page size accepted by the list endpoints (see list_agent_messages /
+# get_agent_chat_context docstrings: "max: 100"). Fewer pages, fewer round-trips.
+# THENVOI_TEST_PAGE_SIZE overrides it, e.g. a small value exercises the
+# multi-page paths against an account with few peers or chats.
+MAX_PAGE_SIZE = int(os.environ.get("THENVOI_TEST_PAGE_SIZE", "100"))
+
+# Keep-alive pool shared by every client in the session, so each request
+# reuses an open connection instead of paying a new TCP + TLS handshake.
+HTTP_POOL_SIZE = 10
+
+# Timeout for the one-off reachability probe, short enough that an
+# unreachable host fails fast
+PROBE_TIMEOUT_SECONDS = 5.0
+
+# Timeout for API calls on the shared client, matching RestClient's own
+# default rather than httpx's much shorter one
+REQUEST_TIMEOUT_SECONDS = 60.0
 
 
 @dataclass
@@ -55,31 +113,106 @@ class IntegrationRequestContext:
 
 
 class IntegrationContext:
-    """Real MCP Context for integration testing with actual API client."""
+    """Real MCP Context for integration testing with actual API client.
+
+    ``page_cache`` holds fully paginated results for the pagination helpers;
+    see ``tests.integration.pagination.invalidate_cache``. ``pager`` limits
+    how many of their page requests are in flight at once.
+    """
 
     def __init__(self, client: RestClient):
         self.request_context = IntegrationRequestContext(
             lifespan_context=AppContext(client=client)
         )
+        self.page_cache: dict[tuple, list[dict]] = {}
+        self.pager = AdaptivePager()
+
+
+def _error_response(status_code: int, detail: str) -> httpx.Response:
+    return httpx.Response(status_code, json={"errors": {"detail": detail}})
+
+
+def _mock_api_handler(request: httpx.Request) -> httpx.Response:
+    """Answer the requests made by the error-case tests with canned errors."""
+    if FAKE_CHAT_ID in request.url.path:
+        return _error_response(404, "Chat not found")
+    if FAKE_PARTICIPANT_ID in request.url.path or (
+        FAKE_PARTICIPANT_ID.encode() in request.content
+    ):
+        return _error_response(404, "Participant not found")
+    if b"not-a-valid-uuid" in request.content:
+        return _error_response(422, "participant_id is not a valid UUID")
+    return _error_response(501, f"No mock for {request.method} {request.url.path}")
 
 
 @pytest.fixture(scope="session")
-def api_client() -> RestClient | None:
+def http_client() -> Iterator[httpx.Client]:
+    """Pooled HTTP client shared by all API clients in the session.
+
+    With USE_MOCK_API=1 the client is backed by _mock_api_handler instead of
+    the network. Otherwise, when an API key is configured, the server is
+    probed once here so an unreachable host skips every dependent test
+    instead of each one waiting for its own timeout.
+    """
+    if USE_MOCK_API:
+        with httpx.Client(transport=httpx.MockTransport(_mock_api_handler)) as client:
+            yield client
+        return
+
+    limits = httpx.Limits(
+        max_connections=HTTP_POOL_SIZE,
+        max_keepalive_connections=HTTP_POOL_SIZE,
+    )
+    with httpx.Client(limits=limits, timeout=REQUEST_TIMEOUT_SECONDS) as client:
+        if get_api_key():
+            try:
+                client.head(get_base_url(), timeout=PROBE_TIMEOUT_SECONDS)
+            except httpx.TransportError as exc:
+                pytest.skip(f"API at {get_base_url()} is unreachable: {exc}")
+        yield client
+
+
+@pytest.fixture(scope="session")
+def api_client(http_client: httpx.Client) -> RestClient | None:
     """Create a real API client for integration tests.
 
-    Returns None if THENVOI_API_KEY is not set.
+    Returns None if THENVOI_API_KEY is not set and USE_MOCK_API is off.
     """
-    api_key = get_api_key()
+    api_key = "mock-api-key" if USE_MOCK_API else get_api_key()
     if not api_key:
         return None
 
     return RestClient(
         api_key=api_key,
         base_url=get_base_url(),
+        httpx_client=http_client,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def bad_client(http_client: httpx.Client) -> Iterator[RestClient]:
+    """Create an API client with an invalid key for authentication tests."""
+    if USE_MOCK_API:
+        # Every request made with the bad key is rejected
+        transport = httpx.MockTransport(
+            lambda request: _error_response(401, "Invalid API key")
+        )
+        with httpx.Client(transport=transport) as client:
+            yield RestClient(
+                api_key="not-a-real-key",  # noqa: S106
+                base_url=get_base_url(),
+                httpx_client=client,
+            )
+        return
+
+    yield RestClient(
+        api_key="not-a-real-key",  # noqa: S106
+        base_url=get_base_url(),
+        httpx_client=http_client,
+    )
+
+
+@pytest.fixture(scope="session")
 def integration_ctx(api_client: RestClient | None) -> IntegrationContext:
     """Create a real Context for integration tests.
 
@@ -91,37 +224,70 @@ def integration_ctx(api_client: RestClient | None) -> IntegrationContext:
     return IntegrationContext(client=api_client)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_chat(api_client: RestClient | None):
-    """Create a temporary chat for testing and clean up after.
+    """Create a temporary chat shared by every test in the session.
 
-    Yields the chat ID for use in tests.
+    Yields the chat ID for use in tests. Tests that add participants must
+    remove them again so the chat is empty for the next test. Under
+    pytest-xdist each worker has its own session, and the title carries the
+    worker id so chats created by parallel workers are easy to tell apart.
     Note: Cleanup may not be possible if delete is not supported.
     """
     if api_client is None:
         pytest.skip("THENVOI_API_KEY not set")
 
+    if USE_MOCK_API:
+        # The mock only answers error cases, so there is no chat to create
+        yield MOCK_CHAT_ID
+        return
+
     from thenvoi_rest import ChatRoomRequest
 
     # Create a test chat
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
     response = api_client.agent_api.create_agent_chat(
-        chat=ChatRoomRequest(title="Integration Test Chat")
+        chat=ChatRoomRequest(title=f"Integration Test Chat ({worker})")
     )
     chat_id = response.data.id
 
     yield chat_id
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_peer_id(api_client: RestClient | None) -> str | None:
     """Get a peer ID that can be used for testing participant operations.
 
-    Returns the first available peer (agent or user) that can be added to chats.
+    Returns the first available peer (agent or user) that can be added to chats,
+    or None with USE_MOCK_API=1 since the mock has no peers.
     """
     if api_client is None:
         pytest.skip("THENVOI_API_KEY not set")
 
+    if USE_MOCK_API:
+        return None
+
     response = api_client.agent_api.list_agent_peers()
     if response.data:
         return response.data[0].id
     return None
+
+
+@pytest.fixture(scope="session")
+def agent_identity(integration_ctx: IntegrationContext) -> dict:
+    """Profile of the authenticated agent, fetched once per session."""
+    from thenvoi_mcp.tools.agent.agent_identity import get_agent_me
+
+    return loads(get_agent_me(integration_ctx))["data"]
+
+
+@pytest.fixture(scope="session")
+def user_peer(integration_ctx: IntegrationContext) -> dict:
+    """First User (human) peer of the agent, found once per session."""
+    from tests.integration.pagination import fetch_all_pages
+    from thenvoi_mcp.tools.agent.agent_identity import list_agent_peers
+
+    peers = fetch_all_pages(integration_ctx, list_agent_peers, use_cache=True)
+    peer = next((p for p in peers if p["type"] == "User"), None)
+    assert peer is not None, "Need at least one User peer"
+    return peer
@@ -5,27 +5,49 @@ Credentials are loaded from .env.test automatically.
 """
 
 from tests.conftest_integration import (
+    FAKE_CHAT_ID,
+    FAKE_PARTICIPANT_ID,
+    MAX_PAGE_SIZE,
+    USE_MOCK_API,
     IntegrationContext,
+    agent_identity,
     api_client,
+    bad_client,
+    dumps,
     get_api_key,
     get_base_url,
     get_test_agent_id,
+    http_client,
     integration_ctx,
+    loads,
     requires_api,
+    requires_api_or_mock,
     test_chat,
     test_peer_id,
     test_settings,
+    user_peer,
 )
 
 __all__ = [
+    "FAKE_CHAT_ID",
+    "FAKE_PARTICIPANT_ID",
+    "MAX_PAGE_SIZE",
+    "USE_MOCK_API",
     "IntegrationContext",
+    "agent_identity",
     "api_client",
+    "bad_client",
+    "dumps",
     "get_api_key",
     "get_base_url",
     "get_test_agent_id",
+    "http_client",
     "integration_ctx",
+    "loads",
     "requires_api",
+    "requires_api_or_mock",
     "test_chat",
     "test_peer_id",
     "test_settings",
+    "user_peer",
 ]
@@ -0,0 +1,85 @@
+"""Adaptive concurrency limit for the integration pagination helpers.
+
+Kept free of the integration settings and fixtures so it can be unit tested
+without an API server or ``.env.test``.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+
+from thenvoi_rest.core.api_error import ApiError
+
+# Upper bound on concurrent page requests per fetch
+FETCH_WORKERS = 8
+
+# Responses that mean the server is overloaded rather than the request is bad
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class AdaptivePager:
+    """Adaptive limit on concurrent page requests.
+
+    Starts at ``initial`` requests in flight. A retryable error halves the
+    limit (down to ``minimum``) and the request is retried after an
+    exponential delay; every ``recover_after`` consecutive successes raise the
+    limit by one again, up to ``initial``. One instance lives on each
+    ``IntegrationContext`` so the safe level carries over between fetches.
+    """
+
+    def __init__(
+        self,
+        initial: int = FETCH_WORKERS,
+        minimum: int = 1,
+        recover_after: int = 20,
+        retries: int = 3,
+        base_delay: float = 0.5,
+    ):
+        self.initial = initial
+        self.minimum = minimum
+        self.recover_after = recover_after
+        self.retries = retries
+        self.base_delay = base_delay
+        self.limit = initial
+        self._in_flight = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+
+    def call(self, func: Callable[..., str], *args, **kwargs) -> str:
+        """Call ``func`` once a slot is free, retrying retryable API errors."""
+        attempt = 0
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._in_flight < self.limit)
+                self._in_flight += 1
+            try:
+                result = func(*args, **kwargs)
+            except ApiError as exc:
+                if (
+                    exc.status_code not in RETRYABLE_STATUS_CODES
+                    or attempt >= self.retries
+                ):
+                    raise
+                self._back_off()
+            else:
+                self._record_success()
+                return result
+            finally:
+                with self._cond:
+                    self._in_flight -= 1
+                    self._cond.notify_all()
+            time.sleep(self.base_delay * 2**attempt)
+            attempt += 1
+
+    def _back_off(self) -> None:
+        with self._cond:
+            self.limit = max(self.minimum, self.limit // 2)
+            self._successes = 0
+
+    def _record_success(self) -> None:
+        with self._cond:
+            self._successes += 1
+            if self._successes >= self.recover_after and self.limit < self.initial:
+                self.limit += 1
+                self._successes = 0
+                self._cond.notify_all()
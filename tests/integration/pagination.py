@@ -0,0 +1,233 @@
+"""Pagination helpers for integration tests.
+
+The MCP list tools return a JSON string with a ``data`` list and a
+``metadata.total_pages`` count. These helpers walk every page of such a tool,
+parsing each page once with the shared ``loads``.
+"""
+
+from collections import defaultdict
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import partial
+from types import MappingProxyType
+from typing import Any
+
+from tests.conftest_integration import MAX_PAGE_SIZE, loads
+from tests.integration.pager import FETCH_WORKERS
+from thenvoi_mcp.tools.agent.agent_messages import get_agent_chat_context
+
+# Shared read-only fallbacks for a missing "data" or "metadata" field, so the
+# per-page lookups don't build a fresh empty container each time
+_EMPTY: tuple = ()
+_NO_METADATA = MappingProxyType({})
+
+
+def _page_fetcher(
+    ctx,
+    list_func: Callable[..., str],
+    page_size: int,
+    kwargs: dict[str, Any],
+) -> Callable[..., str]:
+    """Bind ``list_func`` to everything but ``page``, routed through ``ctx.pager``.
+
+    The pager caps concurrent requests and backs off on 429/5xx responses.
+    """
+    fetch_page = partial(list_func, ctx, page_size=page_size, **kwargs)
+    pager = getattr(ctx, "pager", None)
+    return fetch_page if pager is None else partial(pager.call, fetch_page)
+
+
+def fetch_all_pages(
+    ctx,
+    list_func: Callable[..., str],
+    page_size: int = MAX_PAGE_SIZE,
+    use_cache: bool = False,
+    **kwargs: Any,
+) -> list[dict[str, Any]]:
+    """Fetch every page of a list tool.
+
+    Page 1 is fetched first to learn ``total_pages``; the remaining pages are
+    independent requests and are fetched concurrently. With ``use_cache``,
+    results are cached on ``ctx.page_cache`` by tool, page size and
+    arguments, which must then be hashable; callers get a copy of the cached
+    list. Call ``invalidate_cache`` after changing what a tool lists.
+
+    Args:
+        ctx: Integration context
+        list_func: MCP list tool accepting ``page`` and ``page_size``
+        page_size: Number of items per page
+        use_cache: Read and populate ``ctx.page_cache``
+        **kwargs: Extra arguments passed to ``list_func`` on every page
+
+    Returns:
+        List of all items across all pages
+    """
+    cache = getattr(ctx, "page_cache", None) if use_cache else None
+    if cache is not None:
+        cache_key = (list_func, page_size, frozenset(kwargs.items()))
+        if cache_key in cache:
+            return list(cache[cache_key])
+
+    fetch_page = _page_fetcher(ctx, list_func, page_size, kwargs)
+
+    first = loads(fetch_page(page=1))
+    all_items: list[dict[str, Any]] = first.get("data") or []
+    total_pages = (first.get("metadata") or _NO_METADATA).get("total_pages", 1)
+
+    if total_pages > 1:
+        extend = all_items.extend
+        workers = min(FETCH_WORKERS, total_pages - 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # map() yields results in page order regardless of completion order
+            for result in executor.map(
+                lambda page: fetch_page(page=page), range(2, total_pages + 1)
+            ):
+                extend(loads(result).get("data") or _EMPTY)
+
+    if cache is not None:
+        cache[cache_key] = all_items
+        return list(all_items)
+    return all_items
+
+
+def invalidate_cache(
+    ctx, list_func: Callable[..., str] | None = None, **kwargs: Any
+) -> None:
+    """Drop cached ``fetch_all_pages`` results.
+
+    With no ``list_func`` the whole cache is cleared. Otherwise only that
+    tool's results are dropped, limited to the calls made with exactly
+    ``kwargs`` when any are given.
+    """
+    cache = getattr(ctx, "page_cache", None)
+    if cache is None:
+        return
+    if list_func is None:
+        cache.clear()
+        return
+    arguments = frozenset(kwargs.items()) if kwargs else None
+    for cache_key in [
+        k
+        for k in cache
+        if k[0] is list_func and (arguments is None or k[2] == arguments)
+    ]:
+        del cache[cache_key]
+
+
+def _iter_pages(
+    ctx,
+    list_func: Callable[..., str],
+    page_size: int,
+    **kwargs: Any,
+) -> Iterator[Sequence[dict[str, Any]]]:
+    """Yield the ``data`` of each page in order, prefetching from page 2 on.
+
+    Page 1 is yielded before anything else is requested, since most lookups
+    match there. After that, page P+1 is requested before page P is parsed
+    and yielded, so the caller's scan overlaps the network wait. Closing the
+    generator cancels a prefetch that hasn't started and waits for one that
+    has, so no request outlives the walk.
+    """
+    fetch_page = _page_fetcher(ctx, list_func, page_size, kwargs)
+
+    parsed = loads(fetch_page(page=1))
+    total_pages = (parsed.get("metadata") or _NO_METADATA).get("total_pages", 1)
+    yield parsed.get("data") or _EMPTY
+    if total_pages < 2:
+        return
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        prefetch = executor.submit(fetch_page, page=2)
+        for page in range(2, total_pages + 1):
+            result = prefetch.result()
+            if page < total_pages:
+                prefetch = executor.submit(fetch_page, page=page + 1)
+            yield loads(result).get("data") or _EMPTY
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def find_item_in_pages(
+    ctx,
+    list_func: Callable[..., str],
+    predicate: Callable[[dict[str, Any]], bool],
+    page_size: int = MAX_PAGE_SIZE,
+    **kwargs: Any,
+) -> dict[str, Any] | None:
+    """Return the first item matching ``predicate``, stopping at that page.
+
+    From page 2 on, the next page is requested while the current one is
+    scanned. A match waits for that request to finish and discards its page.
+
+    Args:
+        ctx: Integration context
+        list_func: MCP list tool accepting ``page`` and ``page_size``
+        predicate: Called with each item; the first truthy match wins
+        page_size: Number of items per page
+        **kwargs: Extra arguments passed to ``list_func`` on every page
+
+    Returns:
+        The matching item, or None if no page contains one
+    """
+    with closing(_iter_pages(ctx, list_func, page_size, **kwargs)) as pages:
+        for data in pages:
+            match = next(filter(predicate, data), None)
+            if match is not None:
+                return match
+    return None
+
+
+def fetch_all_pages_and_index(
+    ctx,
+    list_func: Callable[..., str],
+    key: str = "id",
+    page_size: int = MAX_PAGE_SIZE,
+    **kwargs: Any,
+) -> tuple[list[dict[str, Any]], set[Any]]:
+    """Fetch every page of a list tool and the set of each item's ``key``.
+
+    Returns:
+        Tuple of all items across all pages and the set of their ``key`` values
+    """
+    items = fetch_all_pages(ctx, list_func, page_size=page_size, **kwargs)
+    return items, {item.get(key) for item in items}
+
+
+def fetch_all_context(
+    ctx,
+    chat_id: str,
+    page_size: int = MAX_PAGE_SIZE,
+) -> list[dict[str, Any]]:
+    """Fetch all pages of chat context.
+
+    Args:
+        ctx: Integration context
+        chat_id: The chat ID to get context for
+        page_size: Number of items per page
+
+    Returns:
+        List of all context items across all pages
+    """
+    return fetch_all_pages(
+        ctx, get_agent_chat_context, page_size=page_size, chat_id=chat_id
+    )
+
+
+def index_by(items: list[dict[str, Any]], key: str = "id") -> dict[Any, dict[str, Any]]:
+    """Map each item's ``key`` to the item, for O(1) membership and lookup."""
+    return {item[key]: item for item in items}
+
+
+def group_by(
+    items: list[dict[str, Any]], key: str
+) -> defaultdict[Any, list[dict[str, Any]]]:
+    """Bucket items by their ``key`` value, keeping the original order.
+
+    Missing keys read as an empty list, so callers can index any bucket.
+    """
+    groups: defaultdict[Any, list[dict[str, Any]]] = defaultdict(list)
+    for item in items:
+        groups[item.get(key)].append(item)
+    return groups
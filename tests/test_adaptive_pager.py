@@ -0,0 +1,83 @@
+"""Unit tests for the AdaptivePager used by the integration pagination helpers."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from thenvoi_rest.core.api_error import ApiError
+
+from tests.integration.pager import AdaptivePager
+
+
+def api_error(status_code: int) -> ApiError:
+    return ApiError(status_code=status_code, body=None)
+
+
+class TestAdaptivePager:
+    """Tests for AdaptivePager back-off, recovery and retry limits."""
+
+    def test_halves_limit_on_429(self):
+        """Test that a rate-limited request halves the limit and is retried."""
+        pager = AdaptivePager(initial=8, base_delay=0)
+        func = MagicMock(side_effect=[api_error(429), "page"])
+
+        result = pager.call(func, page=2)
+
+        assert result == "page"
+        assert func.call_count == 2
+        func.assert_called_with(page=2)
+        assert pager.limit == 4
+
+    def test_limit_never_drops_below_minimum(self):
+        """Test that repeated back-offs stop at the minimum limit."""
+        pager = AdaptivePager(initial=4, minimum=2, retries=5, base_delay=0)
+        func = MagicMock(side_effect=[api_error(503)] * 3 + ["page"])
+
+        pager.call(func)
+
+        assert pager.limit == 2
+
+    def test_recovers_after_consecutive_successes(self):
+        """Test that the limit grows by one per recover_after successes."""
+        pager = AdaptivePager(initial=8, recover_after=3, base_delay=0)
+        # The successful retry is the first success after the back-off
+        pager.call(MagicMock(side_effect=[api_error(429), "page"]))
+        assert pager.limit == 4
+
+        func = MagicMock(return_value="page")
+        pager.call(func)
+        assert pager.limit == 4
+
+        pager.call(func)
+        assert pager.limit == 5
+
+    def test_limit_never_exceeds_initial(self):
+        """Test that successes at the initial limit don't raise it further."""
+        pager = AdaptivePager(initial=2, recover_after=1, base_delay=0)
+        func = MagicMock(return_value="page")
+
+        for _ in range(3):
+            pager.call(func)
+
+        assert pager.limit == 2
+
+    def test_reraises_when_retries_exhausted(self):
+        """Test that the last retryable error is raised once retries run out."""
+        pager = AdaptivePager(initial=8, retries=2, base_delay=0)
+        func = MagicMock(side_effect=api_error(500))
+
+        with pytest.raises(ApiError) as exc_info:
+            pager.call(func)
+
+        assert exc_info.value.status_code == 500
+        assert func.call_count == 3
+
+    def test_does_not_retry_other_errors(self):
+        """Test that non-retryable errors are raised at once without backing off."""
+        pager = AdaptivePager(initial=8, base_delay=0)
+        func = MagicMock(side_effect=api_error(404))
+
+        with pytest.raises(ApiError):
+            pager.call(func)
+
+        assert func.call_count == 1
+        assert pager.limit == 8
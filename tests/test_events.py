@@ -10,6 +10,36 @@ from thenvoi_mcp.tools.agent.agent_events import (
     create_agent_chat_event,
 )
 
+EXPECTED_EVENT_TYPES = frozenset(
+    {"tool_call", "tool_result", "thought", "error", "task"}
+)
+
+# Metadata payloads as clients send them; the expected dicts are parsed once
+# at import in the parametrize table below
+TOOL_CALL_METADATA = '{"function": {"name": "get_weather", "arguments": {"city": "NYC"}}, "id": "call_1", "type": "function"}'
+TOOL_RESULT_METADATA = '{"success": true, "temperature": 72, "conditions": "sunny"}'
+ERROR_METADATA = '{"error_code": "RATE_LIMIT", "retry_after": 60}'
+
+
+class _EventMatching:
+    """Equal to any event request whose attributes have the given values."""
+
+    def __init__(self, **attrs):
+        self.attrs = attrs
+
+    def __eq__(self, other):
+        missing = object()
+        return all(getattr(other, k, missing) == v for k, v in self.attrs.items())
+
+    def __repr__(self):
+        return f"<event matching {self.attrs!r}>"
+
+
+@pytest.fixture(scope="module")
+def event_response():
+    """Canned API response for tests that only inspect the request sent."""
+    return factory.response(factory.chat_event())
+
 
 class TestCreateAgentChatEvent:
     """Tests for create_agent_chat_event tool."""
@@ -27,91 +57,18 @@ class TestCreateAgentChatEvent:
             mock_ctx, chat_id=chat_id, content=content, message_type="thought"
         )
 
-        mock_agent_api.create_agent_chat_event.assert_called_once()
-        call_args = mock_agent_api.create_agent_chat_event.call_args
-        assert call_args.kwargs["chat_id"] == chat_id
-        assert call_args.kwargs["event"].content == content
-        assert call_args.kwargs["event"].message_type == "thought"
-        parsed = json.loads(result)
-        assert parsed["data"]["id"] == "event-456"
-
-    def test_creates_tool_call_event(self, mock_ctx, mock_agent_api):
-        """Test creating a tool_call event with metadata."""
-        chat_id = "chat-123"
-        content = "Calling weather_service"
-        metadata = '{"function": {"name": "get_weather", "arguments": {"city": "NYC"}}, "id": "call_1", "type": "function"}'
-        event = factory.chat_event(id="event-789", message_type="tool_call")
-        mock_agent_api.create_agent_chat_event.return_value = factory.response(event)
-
-        create_agent_chat_event(
-            mock_ctx,
-            chat_id=chat_id,
-            content=content,
-            message_type="tool_call",
-            metadata=metadata,
-        )
-
-        call_args = mock_agent_api.create_agent_chat_event.call_args
-        assert call_args.kwargs["event"].message_type == "tool_call"
-        assert call_args.kwargs["event"].metadata["function"]["name"] == "get_weather"
-
-    def test_creates_tool_result_event(self, mock_ctx, mock_agent_api):
-        """Test creating a tool_result event with metadata."""
-        chat_id = "chat-123"
-        content = "Weather retrieved successfully"
-        metadata = '{"success": true, "temperature": 72, "conditions": "sunny"}'
-        event = factory.chat_event(id="event-101", message_type="tool_result")
-        mock_agent_api.create_agent_chat_event.return_value = factory.response(event)
-
-        create_agent_chat_event(
-            mock_ctx,
-            chat_id=chat_id,
-            content=content,
-            message_type="tool_result",
-            metadata=metadata,
-        )
-
-        call_args = mock_agent_api.create_agent_chat_event.call_args
-        assert call_args.kwargs["event"].message_type == "tool_result"
-        assert call_args.kwargs["event"].metadata["success"] is True
-
-    def test_creates_error_event(self, mock_ctx, mock_agent_api):
-        """Test creating an error event."""
-        chat_id = "chat-123"
-        content = "API rate limit exceeded"
-        metadata = '{"error_code": "RATE_LIMIT", "retry_after": 60}'
-        event = factory.chat_event(id="event-err", message_type="error")
-        mock_agent_api.create_agent_chat_event.return_value = factory.response(event)
-
-        create_agent_chat_event(
-            mock_ctx,
+        mock_agent_api.create_agent_chat_event.assert_called_once_with(
             chat_id=chat_id,
-            content=content,
-            message_type="error",
-            metadata=metadata,
-        )
-
-        call_args = mock_agent_api.create_agent_chat_event.call_args
-        assert call_args.kwargs["event"].message_type == "error"
-
-    def test_creates_task_event(self, mock_ctx, mock_agent_api):
-        """Test creating a task event."""
-        chat_id = "chat-123"
-        content = "Task started"
-        event = factory.chat_event(id="event-task", message_type="task")
-        mock_agent_api.create_agent_chat_event.return_value = factory.response(event)
-
-        create_agent_chat_event(
-            mock_ctx, chat_id=chat_id, content=content, message_type="task"
+            event=_EventMatching(content=content, message_type="thought"),
         )
+        parsed = json.loads(result)
+        assert parsed["data"]["id"] == "event-456"
 
-        call_args = mock_agent_api.create_agent_chat_event.call_args
-        assert call_args.kwargs["event"].message_type == "task"
-
-    def test_creates_event_without_metadata(self, mock_ctx, mock_agent_api):
+    def test_creates_event_without_metadata(
+        self, mock_ctx, mock_agent_api, event_response
+    ):
         """Test creating an event without metadata."""
-        event = factory.chat_event(id="event-no-meta")
-        mock_agent_api.create_agent_chat_event.return_value = factory.response(event)
+        mock_agent_api.create_agent_chat_event.return_value = event_response
 
         create_agent_chat_event(
             mock_ctx,
@@ -123,10 +80,11 @@ class TestCreateAgentChatEvent:
         call_args = mock_agent_api.create_agent_chat_event.call_args
         assert call_args.kwargs["event"].metadata is None
 
-    def test_message_type_is_case_insensitive(self, mock_ctx, mock_agent_api):
+    def test_message_type_is_case_insensitive(
+        self, mock_ctx, mock_agent_api, event_response
+    ):
         """Test that message_type parameter is case insensitive."""
-        event = factory.chat_event(id="event-case")
-        mock_agent_api.create_agent_chat_event.return_value = factory.response(event)
+        mock_agent_api.create_agent_chat_event.return_value = event_response
 
         create_agent_chat_event(
             mock_ctx, chat_id="chat-123", content="Test", message_type="THOUGHT"
@@ -155,20 +113,39 @@ class TestCreateAgentChatEvent:
 
     def test_valid_event_types_constant(self):
         """Test that VALID_EVENT_TYPES contains expected values."""
-        expected = {"tool_call", "tool_result", "thought", "error", "task"}
-        assert VALID_EVENT_TYPES == expected
+        assert VALID_EVENT_TYPES == EXPECTED_EVENT_TYPES
 
     @pytest.mark.parametrize(
-        "event_type", ["tool_call", "tool_result", "thought", "error", "task"]
+        ("event_type", "metadata", "expected_metadata"),
+        [
+            ("tool_call", TOOL_CALL_METADATA, json.loads(TOOL_CALL_METADATA)),
+            ("tool_result", TOOL_RESULT_METADATA, json.loads(TOOL_RESULT_METADATA)),
+            ("thought", None, None),
+            ("error", ERROR_METADATA, json.loads(ERROR_METADATA)),
+            ("task", None, None),
+        ],
     )
-    def test_all_valid_event_types_accepted(self, mock_ctx, mock_agent_api, event_type):
-        """Test that all valid event types are accepted."""
-        event = factory.chat_event(message_type=event_type)
-        mock_agent_api.create_agent_chat_event.return_value = factory.response(event)
+    def test_all_valid_event_types_accepted(
+        self,
+        mock_ctx,
+        mock_agent_api,
+        event_response,
+        event_type,
+        metadata,
+        expected_metadata,
+    ):
+        """Test that every valid event type is accepted, with its metadata."""
+        mock_agent_api.create_agent_chat_event.return_value = event_response
 
         create_agent_chat_event(
-            mock_ctx, chat_id="chat-123", content="Test", message_type=event_type
+            mock_ctx,
+            chat_id="chat-123",
+            content="Test",
+            message_type=event_type,
+            metadata=metadata,
         )
 
-        call_args = mock_agent_api.create_agent_chat_event.call_args
-        assert call_args.kwargs["event"].message_type == event_type
+        mock_agent_api.create_agent_chat_event.assert_called_once_with(
+            chat_id="chat-123",
+            event=_EventMatching(message_type=event_type, metadata=expected_metadata),
+        )
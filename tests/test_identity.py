@@ -6,6 +6,9 @@ import json
 from thenvoi_testing.factories import factory
 from thenvoi_mcp.tools.agent.agent_identity import get_agent_me, list_agent_peers
 
+# Only ever read by the tools, so one instance serves every empty-list test
+EMPTY_PEERS = factory.list_response([])
+
 
 class TestGetAgentMe:
     """Tests for get_agent_me tool."""
@@ -75,7 +78,7 @@ class TestListAgentPeers:
 
     def test_pagination_parameters(self, mock_ctx, mock_agent_api):
         """Test pagination parameters are passed through."""
-        mock_agent_api.list_agent_peers.return_value = factory.list_response([])
+        mock_agent_api.list_agent_peers.return_value = EMPTY_PEERS
 
         list_agent_peers(mock_ctx, page=2, page_size=10)
 
@@ -87,7 +90,7 @@ class TestListAgentPeers:
 
     def test_empty_peer_list(self, mock_ctx, mock_agent_api):
         """Test handling of empty peer list."""
-        mock_agent_api.list_agent_peers.return_value = factory.list_response([])
+        mock_agent_api.list_agent_peers.return_value = EMPTY_PEERS
 
         result = list_agent_peers(mock_ctx)
 
@@ -15,6 +15,10 @@ from thenvoi_mcp.tools.agent.agent_messages import (
     list_agent_messages,
 )
 
+# Responses the tools only read; shared by tests that don't assert on them
+EMPTY_LIST = factory.list_response([])
+MESSAGE_RESPONSE = factory.response(factory.chat_message(id="msg-789"))
+
 
 class TestListAgentMessages:
     """Tests for list_agent_messages tool."""
@@ -43,7 +47,7 @@ class TestListAgentMessages:
 
     def test_status_filter(self, mock_ctx, mock_agent_api):
         """Test filtering messages by status."""
-        mock_agent_api.list_agent_messages.return_value = factory.list_response([])
+        mock_agent_api.list_agent_messages.return_value = EMPTY_LIST
 
         list_agent_messages(mock_ctx, chat_id="chat-123", status="pending")
 
@@ -56,7 +60,7 @@ class TestListAgentMessages:
 
     def test_pagination_parameters(self, mock_ctx, mock_agent_api):
         """Test pagination parameters are passed through."""
-        mock_agent_api.list_agent_messages.return_value = factory.list_response([])
+        mock_agent_api.list_agent_messages.return_value = EMPTY_LIST
 
         list_agent_messages(mock_ctx, chat_id="chat-123", page=2, page_size=25)
 
@@ -69,7 +73,7 @@ class TestListAgentMessages:
 
     def test_empty_messages(self, mock_ctx, mock_agent_api):
         """Test handling of empty message list."""
-        mock_agent_api.list_agent_messages.return_value = factory.list_response([])
+        mock_agent_api.list_agent_messages.return_value = EMPTY_LIST
 
         result = list_agent_messages(mock_ctx, chat_id="empty-chat")
 
@@ -149,7 +153,7 @@ class TestGetAgentChatContext:
 
     def test_pagination_parameters(self, mock_ctx, mock_agent_api):
         """Test pagination parameters are passed through."""
-        mock_agent_api.get_agent_chat_context.return_value = factory.list_response([])
+        mock_agent_api.get_agent_chat_context.return_value = EMPTY_LIST
 
         get_agent_chat_context(mock_ctx, chat_id="chat-123", page=2, page_size=25)
 
@@ -161,7 +165,7 @@ class TestGetAgentChatContext:
 
     def test_empty_context(self, mock_ctx, mock_agent_api):
         """Test handling of empty context."""
-        mock_agent_api.get_agent_chat_context.return_value = factory.list_response([])
+        mock_agent_api.get_agent_chat_context.return_value = EMPTY_LIST
 
         result = get_agent_chat_context(mock_ctx, chat_id="empty-chat")
 
@@ -220,10 +224,7 @@ class TestCreateAgentChatMessage:
         """Test that mentions takes precedence when both are provided."""
         chat_id = "chat-123"
         mentions = '[{"id": "agent-456", "name": "Weather Agent"}]'
-        message = factory.chat_message(id="msg-789")
-        mock_agent_api.create_agent_chat_message.return_value = factory.response(
-            message
-        )
+        mock_agent_api.create_agent_chat_message.return_value = MESSAGE_RESPONSE
 
         create_agent_chat_message(
             mock_ctx,
@@ -282,10 +283,7 @@ class TestCreateAgentChatMessage:
         mock_agent_api.list_agent_chat_participants.return_value = (
             factory.list_response(participants)
         )
-        message = factory.chat_message(id="msg-789")
-        mock_agent_api.create_agent_chat_message.return_value = factory.response(
-            message
-        )
+        mock_agent_api.create_agent_chat_message.return_value = MESSAGE_RESPONSE
 
         create_agent_chat_message(
             mock_ctx,
@@ -304,10 +302,7 @@ class TestCreateAgentChatMessage:
         mock_agent_api.list_agent_chat_participants.return_value = (
             factory.list_response([participant])
         )
-        message = factory.chat_message(id="msg-789")
-        mock_agent_api.create_agent_chat_message.return_value = factory.response(
-            message
-        )
+        mock_agent_api.create_agent_chat_message.return_value = MESSAGE_RESPONSE
 
         create_agent_chat_message(
             mock_ctx, chat_id="chat-123", content="Hello!", recipients="WEATHER AGENT"
@@ -343,10 +338,7 @@ class TestCreateAgentChatMessage:
         mock_agent_api.list_agent_chat_participants.return_value = MagicMock(
             data=[participant]
         )
-        message = factory.chat_message(id="msg-789")
-        mock_agent_api.create_agent_chat_message.return_value = factory.response(
-            message
-        )
+        mock_agent_api.create_agent_chat_message.return_value = MESSAGE_RESPONSE
 
         create_agent_chat_message(
             mock_ctx, chat_id="chat-123", content="Hello!", recipients="jdoe"
@@ -366,10 +358,7 @@ class TestCreateAgentChatMessage:
         mock_agent_api.list_agent_chat_participants.return_value = MagicMock(
             data=[participant]
         )
-        message = factory.chat_message(id="msg-789")
-        mock_agent_api.create_agent_chat_message.return_value = factory.response(
-            message
-        )
+        mock_agent_api.create_agent_chat_message.return_value = MESSAGE_RESPONSE
 
         create_agent_chat_message(
             mock_ctx, chat_id="chat-123", content="Hello!", recipients="alice smith"
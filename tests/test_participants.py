@@ -62,11 +62,7 @@ class TestListAgentChatParticipants:
 
         parsed = json.loads(result)
         data = parsed["data"][0]
-        assert "id" in data
-        assert "name" in data
-        assert "type" in data
-        assert "role" in data
-        assert "status" in data
+        assert {"id", "name", "type", "role", "status"} <= data.keys()
 
 
 class TestAddAgentChatParticipant: